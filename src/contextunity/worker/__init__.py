@@ -19,17 +19,55 @@ Usage:
     await run_workers()
 """
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from .config import WorkerConfig, get_config
-from .core import (
-    WorkerRegistry,
-    create_worker,
-    get_registry,
-    run_workers,
-)
-from .core.worker import get_temporal_client
-from .schedules import create_schedule, delete_schedule, list_schedules
+if TYPE_CHECKING:
+    from .config import WorkerConfig, get_config
+    from .core import (
+        WorkerRegistry,
+        create_worker,
+        get_registry,
+        run_workers,
+    )
+    from .core.worker import get_temporal_client
+    from .schedules import create_schedule, delete_schedule, list_schedules, list_schedules_all
+
+# Public name -> defining submodule. Resolved on first attribute access (PEP 562)
+# so ``import contextunity.worker`` does not pull in pydantic/temporalio eagerly.
+_LAZY_ATTRS: dict[str, str] = {
+    "WorkerRegistry": ".core",
+    "get_registry": ".core",
+    "create_worker": ".core",
+    "run_workers": ".core",
+    "get_temporal_client": ".core.worker",
+    "WorkerConfig": ".config",
+    "get_config": ".config",
+    "create_schedule": ".schedules",
+    "list_schedules": ".schedules",
+    "list_schedules_all": ".schedules",
+    "delete_schedule": ".schedules",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import public attributes on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved attributes in ``dir()``."""
+    return sorted({*globals(), *_LAZY_ATTRS})
+
 
 __all__ = [
     "__version__",
@@ -45,5 +83,6 @@ __all__ = [
     # Schedules
     "create_schedule",
     "list_schedules",
+    "list_schedules_all",
     "delete_schedule",
 ]
@@ -5,11 +5,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from collections.abc import Callable
 from typing import Annotated
 
 import typer
 from contextunity.core import get_contextunit_logger
-from rich.console import Console
 
 app = typer.Typer(
     name="contextworker",
@@ -17,7 +17,6 @@ app = typer.Typer(
     add_completion=False,
     invoke_without_command=True,
 )
-console = Console()
 logger = get_contextunit_logger(__name__)
 
 
@@ -71,6 +70,15 @@ def run_temporal(
     _run_temporal(modules, temporal_host, log_level)
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when the ``perf`` extra is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def _run_serve() -> None:
     from .server import serve as grpc_serve
 
@@ -102,7 +110,8 @@ def _run_temporal(modules: list[str] | None, temporal_host: str | None, log_leve
             run_workers(
                 modules=modules,
                 temporal_host=temporal_host,
-            )
+            ),
+            loop_factory=_loop_factory(),
         )
     except KeyboardInterrupt:
         logger.info("Shutting down...")
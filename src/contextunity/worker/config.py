@@ -49,6 +49,11 @@ class WorkerConfig(ServiceConfig):
         default="temporal",
         description="Execution engine: 'temporal' (default) or 'huey' (local)",
     )
+    worker_max_concurrent_activities: int = Field(
+        default=0,
+        ge=0,
+        description="Max concurrent activity tasks per Temporal worker (0 = SDK default)",
+    )
 
     @property
     def brain_endpoint(self) -> str:
@@ -57,7 +62,7 @@ class WorkerConfig(ServiceConfig):
 
 
 def _resolve_endpoints(config: WorkerConfig) -> WorkerConfig:
-    """Return a config copy with runtime service endpoints resolved."""
+    """Return the config with runtime service endpoints resolved."""
 
     from contextunity.core.discovery import resolve_service_endpoint
 
@@ -68,11 +73,12 @@ def _resolve_endpoints(config: WorkerConfig) -> WorkerConfig:
         configured_host=config.brain_url,
         default_host="localhost:50051",
     )
-    data = config.model_dump()
-    data["brain_url"] = brain_url
 
     logger.info("Worker service endpoints resolved: brain=%s", brain_url)
-    return WorkerConfig.model_validate(data)
+    if brain_url == config.brain_url:
+        return config
+    # Fields were already validated by load_service_config; copy instead of re-validating.
+    return config.model_copy(update={"brain_url": brain_url})
 
 
 def load_config(config_path: str | None = None) -> WorkerConfig:
@@ -82,6 +88,7 @@ def load_config(config_path: str | None = None) -> WorkerConfig:
         "WORKER_TENANTS": "worker_tenants",
         "WORKER_MODULES": "worker_modules",
         "WORKER_ENGINE": "worker_engine",
+        "WORKER_MAX_CONCURRENT_ACTIVITIES": "worker_max_concurrent_activities",
         "TEMPORAL_NAMESPACE": "temporal_namespace",
     }
 
@@ -7,8 +7,26 @@ Provides:
 - Temporal client/worker factory
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from .registry import WorkerRegistry, get_registry
-from .worker import create_worker, run_workers
+
+if TYPE_CHECKING:
+    from .worker import create_worker, run_workers
+
+
+def __getattr__(name: str) -> object:
+    """Import the Temporal worker factory (temporalio client/worker) on first use."""
+    if name in ("create_worker", "run_workers"):
+        from . import worker
+
+        value = getattr(worker, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "WorkerRegistry",
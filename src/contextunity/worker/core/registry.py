@@ -1,30 +1,85 @@
 """
 Worker Module Registry.
 Handles registration and discovery of worker modules.
-Modules are discovered from configured or built-in Python packages.
+Modules are discovered from configured, entry-point advertised, or built-in
+Python packages.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import importlib
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+from importlib.metadata import entry_points
+from types import MappingProxyType, ModuleType
 
 from contextunity.core import get_contextunit_logger
 from contextunity.worker.types import ActivityCallable, WorkflowClass
 
 logger = get_contextunit_logger(__name__)
 
+# Packages always probed for a ``register_all(registry)`` hook.
+_BUILTIN_PACKAGES: tuple[str, ...] = ("contextunity.worker.jobs",)
 
-@dataclass
+# Entry-point group installed packages use to advertise worker modules.
+# The entry point names a package exposing ``register_all(registry)``.
+ENTRY_POINT_GROUP = "contextunity.worker.modules"
+
+
+@cache
+def _entry_point_packages() -> tuple[str, ...]:
+    """Return packages advertised under ``ENTRY_POINT_GROUP``.
+
+    Scanning installed distribution metadata is comparatively slow, so the
+    result is cached for the process.
+    """
+    return tuple(ep.module for ep in entry_points(group=ENTRY_POINT_GROUP))
+
+
+def _import_package(package: str) -> ModuleType | None:
+    """Import a worker package, returning None when it is not installed."""
+    try:
+        return importlib.import_module(package)
+    except ImportError:
+        return None
+
+
+@dataclass(slots=True)
 class ModuleConfig:
     """Configuration for a registered worker module."""
 
     name: str
     queue: str
-    workflows: list[WorkflowClass] = field(default_factory=list)
-    activities: list[ActivityCallable] = field(default_factory=list)
+    workflows: tuple[WorkflowClass, ...] = ()
+    activities: tuple[ActivityCallable, ...] = ()
     enabled: bool = True
 
 
+@dataclass(frozen=True, slots=True)
+class QueuePlan:
+    """Workflows and activities aggregated across the modules of one queue."""
+
+    modules: tuple[str, ...]
+    workflows: tuple[WorkflowClass, ...]
+    activities: tuple[ActivityCallable, ...]
+
+
+def _build_queue_plan(modules: Iterable[ModuleConfig]) -> dict[str, QueuePlan]:
+    """Group modules by queue and concatenate their workflows and activities."""
+    grouped: dict[str, list[ModuleConfig]] = {}
+    for module in modules:
+        grouped.setdefault(module.queue, []).append(module)
+    return {
+        queue: QueuePlan(
+            modules=tuple(m.name for m in queue_modules),
+            workflows=tuple(w for m in queue_modules for w in m.workflows),
+            activities=tuple(a for m in queue_modules for a in m.activities),
+        )
+        for queue, queue_modules in grouped.items()
+    }
+
+
 class WorkerRegistry:
     """Registry for worker modules.
 
@@ -39,13 +94,34 @@ class WorkerRegistry:
         """Initialize the worker registry."""
         self._modules: dict[str, ModuleConfig] = {}
         self._discovered: bool = False
+        # Derived views are rebuilt lazily when _version moves past _cached_version.
+        self._version: int = 0
+        self._cached_version: int = -1
+        self._all_cache: tuple[ModuleConfig, ...] = ()
+        self._enabled_cache: tuple[ModuleConfig, ...] = ()
+        self._names_cache: frozenset[str] = frozenset()
+        self._plan_cache: Mapping[str, QueuePlan] = MappingProxyType({})
+
+    def _invalidate(self) -> None:
+        """Mark derived module views as stale after a mutation."""
+        self._version += 1
+
+    def _refresh(self) -> None:
+        """Rebuild derived module views if the registry changed."""
+        if self._cached_version == self._version:
+            return
+        self._all_cache = tuple(self._modules.values())
+        self._enabled_cache = tuple(m for m in self._all_cache if m.enabled)
+        self._names_cache = frozenset(self._modules)
+        self._plan_cache = MappingProxyType(_build_queue_plan(self._enabled_cache))
+        self._cached_version = self._version
 
     def register(
         self,
         name: str,
         queue: str,
-        workflows: list[WorkflowClass] | None = None,
-        activities: list[ActivityCallable] | None = None,
+        workflows: Sequence[WorkflowClass] | None = None,
+        activities: Sequence[ActivityCallable] | None = None,
     ) -> None:
         """Register a worker module."""
         if name in self._modules:
@@ -55,41 +131,60 @@ class WorkerRegistry:
         self._modules[name] = ModuleConfig(
             name=name,
             queue=queue,
-            workflows=workflows or [],
-            activities=activities or [],
+            workflows=tuple(workflows) if workflows else (),
+            activities=tuple(activities) if activities else (),
         )
+        self._invalidate()
         logger.info("Registered module: %s (queue=%s)", name, queue)
 
     def get_module(self, name: str) -> ModuleConfig | None:
         """Get a registered module by name."""
         return self._modules.get(name)
 
-    def get_all_modules(self) -> list[ModuleConfig]:
-        """Get all registered modules."""
-        return list(self._modules.values())
+    def get_all_modules(self) -> tuple[ModuleConfig, ...]:
+        """Get all registered modules (cached until the registry changes)."""
+        self._refresh()
+        return self._all_cache
+
+    def get_enabled_modules(self) -> tuple[ModuleConfig, ...]:
+        """Get all enabled modules (cached until the registry changes)."""
+        self._refresh()
+        return self._enabled_cache
 
-    def get_enabled_modules(self) -> list[ModuleConfig]:
-        """Get all enabled modules."""
-        return [m for m in self._modules.values() if m.enabled]
+    def get_module_names(self) -> frozenset[str]:
+        """Get names of all registered modules (cached until the registry changes)."""
+        self._refresh()
+        return self._names_cache
 
     def get_queues(self) -> dict[str, list[ModuleConfig]]:
         """Get unique queues and their modules."""
         queues: dict[str, list[ModuleConfig]] = {}
         for module in self.get_enabled_modules():
-            if module.queue not in queues:
-                queues[module.queue] = []
-            queues[module.queue].append(module)
+            queues.setdefault(module.queue, []).append(module)
         return queues
 
+    def get_queue_plan(self, names: Collection[str] | None = None) -> Mapping[str, QueuePlan]:
+        """Get per-queue workflows/activities for enabled modules.
+
+        When ``names`` is given only those modules are included. The
+        unfiltered plan is cached until the registry changes.
+        """
+        if names is None:
+            self._refresh()
+            return self._plan_cache
+        return _build_queue_plan(m for m in self.get_enabled_modules() if m.name in names)
+
     def disable_module(self, name: str) -> None:
         """Disable a module."""
         if name in self._modules:
             self._modules[name].enabled = False
+            self._invalidate()
 
     def enable_module(self, name: str) -> None:
         """Enable a module."""
         if name in self._modules:
             self._modules[name].enabled = True
+            self._invalidate()
 
     def discover_plugins(self) -> None:
         """Discover and register modules from installed packages."""
@@ -98,29 +193,28 @@ class WorkerRegistry:
 
         self._discovered = True
 
-        known_packages = [
-            "contextunity.worker.jobs",
-        ]
-
         from contextunity.worker.config import get_config
 
+        custom: tuple[str, ...] = ()
         if env_modules := get_config().worker_modules:
-            custom = [m.strip() for m in env_modules.split(",") if m.strip()]
-            known_packages = custom + known_packages
+            custom = tuple(m.strip() for m in env_modules.split(",") if m.strip())
+        # Ordered de-duplication: WORKER_MODULES, entry points, then built-ins.
+        known_packages = tuple(dict.fromkeys((*custom, *_entry_point_packages(), *_BUILTIN_PACKAGES)))
 
         discovered_any = False
         for package in known_packages:
+            mod = _import_package(package)
+            if mod is None:
+                continue
+            register_fn = getattr(mod, "register_all", None)
+            if not callable(register_fn):
+                continue
             try:
-                import importlib
-
-                mod = importlib.import_module(package)
-                register_fn = getattr(mod, "register_all", None)
-                if callable(register_fn):
-                    _ = register_fn(self)
-                    logger.info("Discovered modules from: %s", package)
-                    discovered_any = True
+                _ = register_fn(self)
             except ImportError:
                 continue
+            logger.info("Discovered modules from: %s", package)
+            discovered_any = True
 
         if not discovered_any:
             logger.warning(
@@ -128,12 +222,10 @@ class WorkerRegistry:
             )
 
 
-_registry: WorkerRegistry | None = None
-
-
+@cache
 def get_registry() -> WorkerRegistry:
-    """Get or create the global worker registry."""
-    global _registry
-    if _registry is None:
-        _registry = WorkerRegistry()
-    return _registry
+    """Get or create the global worker registry.
+
+    Call ``get_registry.cache_clear()`` to start from an empty registry.
+    """
+    return WorkerRegistry()
@@ -7,38 +7,81 @@ Creates and runs Temporal workers based on registered modules.
 from __future__ import annotations
 
 import asyncio
+import logging
+from collections.abc import Sequence
+from functools import lru_cache
 
 from contextunity.core import get_contextunit_logger
 from contextunity.worker.types import ActivityCallable, WorkflowClass
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from ..config import get_config
 from .registry import get_registry
 
 logger = get_contextunit_logger(__name__)
 
 
+# Connected clients keyed by host; reused across run_workers/schedule calls.
+_CLIENT_CACHE: dict[str, Client] = {}
+# One lock per host, so a slow connect only holds up callers of that host.
+_CLIENT_LOCKS: dict[str, asyncio.Lock] = {}
+
+
 async def get_temporal_client(host: str | None = None) -> Client:
-    """Get Temporal client connection (host from config if not provided)."""
+    """Get a cached Temporal client connection (host from config if not provided)."""
     if host is None:
-        from ..config import get_config
-
         host = get_config().temporal_host
-    return await Client.connect(host)
+
+    client = _CLIENT_CACHE.get(host)
+    if client is not None:
+        return client
+
+    async with _CLIENT_LOCKS.setdefault(host, asyncio.Lock()):
+        client = _CLIENT_CACHE.get(host)
+        if client is None:
+            client = await Client.connect(host)
+            _CLIENT_CACHE[host] = client
+    return client
+
+
+@lru_cache(maxsize=8)
+def _parse_tenants(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated WORKER_TENANTS value into tenant IDs."""
+    return tuple(t.strip() for t in raw.split(",") if t.strip())
+
+
+def clear_temporal_clients() -> None:
+    """Drop cached Temporal clients so the next call reconnects.
+
+    Temporal clients have no explicit close; connections are released once
+    the client objects are no longer referenced.
+    """
+    _CLIENT_CACHE.clear()
+    _CLIENT_LOCKS.clear()
 
 
 async def create_worker(
     client: Client,
     queue: str,
-    workflows: list[WorkflowClass] | None = None,
-    activities: list[ActivityCallable] | None = None,
+    workflows: Sequence[WorkflowClass] | None = None,
+    activities: Sequence[ActivityCallable] | None = None,
+    max_concurrent_activities: int | None = None,
 ) -> Worker:
-    """Create a Temporal worker for a specific queue."""
+    """Create a Temporal worker for a specific queue.
+
+    ``max_concurrent_activities`` of ``None`` keeps the Temporal SDK default.
+    """
+    # Only pass the slot cap when set: older SDKs type it as a plain int.
+    limits: dict[str, int] = {}
+    if max_concurrent_activities is not None:
+        limits["max_concurrent_activities"] = max_concurrent_activities
     return Worker(
         client,
         task_queue=queue,
-        workflows=workflows or [],
-        activities=activities or [],
+        workflows=workflows or (),
+        activities=activities or (),
+        **limits,
     )
 
 
@@ -51,38 +94,44 @@ async def run_workers(
     registry.discover_plugins()
 
     if modules:
-        known = {m.name for m in registry.get_all_modules()}
+        known = registry.get_module_names()
         for name in modules:
             if name not in known:
                 logger.warning("Module %s not found", name)
+        if known.isdisjoint(modules):
+            logger.error("None of the requested modules are registered: %s", ", ".join(modules))
+            return
 
-    queues = registry.get_queues()
-
-    if not queues:
+    if not registry.get_enabled_modules():
         logger.error("No modules registered. Nothing to run.")
         return
 
+    plan = registry.get_queue_plan(set(modules) if modules else None)
+
     client = await get_temporal_client(temporal_host)
 
+    cfg = get_config()
+    max_activities = cfg.worker_max_concurrent_activities or None
+
     workers: list[Worker] = []
-    for queue, queue_modules in queues.items():
-        if modules:
-            queue_modules = [m for m in queue_modules if m.name in modules]
-            if not queue_modules:
-                continue
-
-        workflows: list[WorkflowClass] = []
-        activities: list[ActivityCallable] = []
-        for mod in queue_modules:
-            workflows.extend(mod.workflows)
-            activities.extend(mod.activities)
-
-        if workflows or activities:
-            worker = await create_worker(client, queue, workflows, activities)
-            workers.append(worker)
-            logger.info("Created worker for queue: %s", queue)
-            logger.info("  Workflows: %s", [w.__name__ for w in workflows])
-            logger.info("  Activities: %s", [a.__name__ for a in activities])
+    served_queues: list[str] = []
+    for queue, queue_plan in plan.items():
+        if not (queue_plan.workflows or queue_plan.activities):
+            continue
+
+        worker = await create_worker(
+            client,
+            queue,
+            queue_plan.workflows,
+            queue_plan.activities,
+            max_concurrent_activities=max_activities,
+        )
+        workers.append(worker)
+        served_queues.append(queue)
+        logger.info("Created worker for queue: %s", queue)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("  Workflows: %s", [w.__name__ for w in queue_plan.workflows])
+            logger.info("  Activities: %s", [a.__name__ for a in queue_plan.activities])
 
     if not workers:
         logger.error("No workers created. Check module configuration.")
@@ -93,14 +142,10 @@ async def run_workers(
     heartbeat_task = None
     try:
         from contextunity.core import register_service
-        from contextunity.worker.config import get_config
-
-        cfg = get_config()
 
         instance_name = cfg.worker_instance_name
         temporal_addr = temporal_host or cfg.temporal_host
-        tenants_raw = cfg.worker_tenants
-        tenants = [t.strip() for t in tenants_raw.split(",") if t.strip()] if tenants_raw else []
+        tenants = list(_parse_tenants(cfg.worker_tenants or ""))
 
         heartbeat_task = await register_service(
             service="worker-temporal",
@@ -108,7 +153,7 @@ async def run_workers(
             endpoint=temporal_addr,
             tenants=tenants,
             metadata={
-                "queues": list(queues.keys()),
+                "queues": served_queues,
                 "worker_count": len(workers),
             },
         )
@@ -122,4 +167,4 @@ async def run_workers(
             _ = heartbeat_task.cancel()
 
 
-__all__ = ["create_worker", "get_temporal_client", "run_workers"]
+__all__ = ["clear_temporal_clients", "create_worker", "get_temporal_client", "run_workers"]
@@ -70,7 +70,7 @@ def get_huey() -> RedisHuey:
             password=password,
             db=db,
         )
-        logger.info(f"Initialized RedisHuey locally on {host}:{port}/{db}")
+        logger.info("Initialized RedisHuey locally on %s:%d/%d", host, port, db)
     return _huey_instance
 
 
@@ -129,7 +129,7 @@ class HueyEngine(BaseTaskEngine):
         # If we had a direct Python mapping:
         # huey.enqueue(workflow_runner_task, workflow_type, tenant_id, workflow_args)
 
-        logger.info(f"[Huey Local] Enqueued workflow '{workflow_type}' as '{workflow_id}'")
+        logger.info("[Huey Local] Enqueued workflow '%s' as '%s'", workflow_type, workflow_id)
 
         # Emulate Temporal payload structure
         return {
@@ -168,5 +168,5 @@ class HueyEngine(BaseTaskEngine):
         Returns:
             The number of successfully registered schedules.
         """
-        logger.info(f"[Huey Local] Registered {len(schedules)} schedules for project {project_id}.")
+        logger.info("[Huey Local] Registered %d schedules for project %s.", len(schedules), project_id)
         return len(schedules)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, override
 
 from contextunity.core import ContextUnit, get_contextunit_logger
@@ -27,11 +28,11 @@ class TemporalEngine(BaseTaskEngine):
         self._client = None
 
     async def _get_client(self) -> Client:
-        """Get or create Temporal client."""
+        """Get the process-wide Temporal client for this engine's host."""
         if self._client is None:
-            from temporalio.client import Client
+            from contextunity.worker.core.worker import get_temporal_client
 
-            self._client = await Client.connect(self.temporal_host)
+            self._client = await get_temporal_client(self.temporal_host)
         return self._client
 
     @override
@@ -110,23 +111,28 @@ class TemporalEngine(BaseTaskEngine):
         """Register schedules in Temporal."""
         _ = project_id, tenant_id
         client = await self._get_client()
-        from contextunity.worker.schedules import create_schedule, schedule_config_from_wire
-
-        registered_count = 0
-        for sched_data in schedules:
-            try:
-                config = schedule_config_from_wire(sched_data)
-                _ = await create_schedule(
-                    client,
-                    schedule_id=config.schedule_id,
-                    workflow=config.workflow_name,
-                    task_queue=config.task_queue,
-                    cron=config.cron,
-                    args=config.args,
-                )
-                registered_count += 1
-            except Exception as exc:
-                sched_id = sched_data.get("id")
-                logger.error("Failed to register schedule %s: %s", sched_id, exc)
-
-        return registered_count
+        from contextunity.worker.schedules import BULK_CONCURRENCY, create_schedule, schedule_config_from_wire
+
+        # Manifests are client-supplied, so cap in-flight create_schedule RPCs.
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def _register(sched_data: dict[str, object]) -> bool:
+            async with semaphore:
+                try:
+                    config = schedule_config_from_wire(sched_data)
+                    _ = await create_schedule(
+                        client,
+                        schedule_id=config.schedule_id,
+                        workflow=config.workflow_name,
+                        task_queue=config.task_queue,
+                        cron=config.cron,
+                        args=config.args,
+                    )
+                    return True
+                except Exception as exc:
+                    sched_id = sched_data.get("id")
+                    logger.error("Failed to register schedule %s: %s", sched_id, exc)
+                    return False
+
+        results = await asyncio.gather(*(_register(sched_data) for sched_data in schedules))
+        return sum(results)
@@ -7,6 +7,8 @@ for unified enforcement logic. Worker only owns the RPC_PERMISSION_MAP.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from contextunity.core.permissions import Permissions
@@ -17,12 +19,14 @@ if TYPE_CHECKING:
 
 # ── RPC → Permission mapping ──────────────────────────────────
 
-RPC_PERMISSION_MAP: dict[str, str] = {
-    "StartWorkflow": Permissions.WORKER_EXECUTE,
-    "GetTaskStatus": Permissions.WORKER_READ,
-    "ExecuteCode": Permissions.WORKER_EXECUTE,
-    "RegisterSchedules": Permissions.WORKER_EXECUTE,
-}
+RPC_PERMISSION_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "StartWorkflow": Permissions.WORKER_EXECUTE,
+        "GetTaskStatus": Permissions.WORKER_READ,
+        "ExecuteCode": Permissions.WORKER_EXECUTE,
+        "RegisterSchedules": Permissions.WORKER_EXECUTE,
+    }
+)
 
 
 class WorkerPermissionInterceptor(ServicePermissionInterceptor):
@@ -40,7 +44,7 @@ class WorkerPermissionInterceptor(ServicePermissionInterceptor):
     def __init__(self, *, shield_url: str = "", config: "WorkerConfig | None" = None) -> None:
         """Initialize the worker permission interceptor."""
         super().__init__(
-            RPC_PERMISSION_MAP,
+            dict(RPC_PERMISSION_MAP),
             service_name="Worker",
             shield_url=shield_url,
             config=config,
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Coroutine
 from datetime import datetime
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from contextunity.core import get_contextunit_logger
-from contextunity.core.sdk import BrainClient
 from contextunity.worker.schemas import EpisodeDict, RetentionStats
 
+if TYPE_CHECKING:
+    from contextunity.core.sdk import BrainClient
+
 logger = get_contextunit_logger(__name__)
 
+# Upper bound on in-flight upsert_fact RPCs during distillation.
+_UPSERT_CONCURRENCY = 8
+
 
 async def run_retention(
     *,
@@ -24,9 +32,10 @@ async def run_retention(
     dry_run: bool = False,
 ) -> RetentionStats:
     """Run episodic memory retention cleanup."""
+    from contextunity.core.sdk import BrainClient
     from contextunity.worker.core.brain_token import get_brain_service_token
 
-    start = datetime.now()
+    start_ns = time.monotonic_ns()
     brain = BrainClient(
         host=brain_endpoint,
         token=get_brain_service_token(allowed_tenants=(tenant_id,)),
@@ -92,7 +101,7 @@ async def run_retention(
                 older_than_days=retention_days,
             )
 
-    duration_ms = int((datetime.now() - start).total_seconds() * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
     logger.info(
         "Retention job complete: deleted=%d, distilled=%d, duration=%dms",
@@ -126,7 +135,27 @@ async def _distill_episodes(
         uid = ep.get("user_id", "unknown")
         by_user.setdefault(uid, []).append(ep)
 
+    source_id = f"retention:{datetime.now().strftime('%Y%m%d')}"
+    semaphore = asyncio.Semaphore(_UPSERT_CONCURRENCY)
+
+    async def _upsert(user_id: str, fact_key: str, fact_value: str) -> bool:
+        async with semaphore:
+            try:
+                await brain.upsert_fact(
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    key=fact_key,
+                    value=fact_value,
+                    confidence=0.8,
+                    source_id=source_id,
+                )
+                return True
+            except Exception as exc:  # graceful-degrade: continue other facts
+                logger.warning("Failed to upsert fact %s for %s: %s", fact_key, user_id, exc)
+                return False
+
     fact_count = 0
+    pending: list[Coroutine[object, object, bool]] = []
     for user_id, user_episodes in by_user.items():
         facts = _extract_facts_simple(user_episodes)
 
@@ -140,40 +169,39 @@ async def _distill_episodes(
             fact_count += len(facts)
             continue
 
-        for fact_key, fact_value in facts.items():
-            try:
-                await brain.upsert_fact(
-                    tenant_id=tenant_id,
-                    user_id=user_id,
-                    key=fact_key,
-                    value=fact_value,
-                    confidence=0.8,
-                    source_id=f"retention:{datetime.now().strftime('%Y%m%d')}",
-                )
-                fact_count += 1
-            except Exception as exc:  # graceful-degrade: continue other facts
-                logger.warning("Failed to upsert fact %s for %s: %s", fact_key, user_id, exc)
+        pending.extend(_upsert(user_id, key, value) for key, value in facts.items())
+
+    if pending:
+        fact_count += sum(await asyncio.gather(*pending))
 
     return fact_count
 
 
 def _extract_facts_simple(episodes: list[EpisodeDict]) -> dict[str, str]:
-    """Simple heuristic fact extraction (no LLM)."""
-    facts: dict[str, str] = {}
-    facts["total_interactions"] = str(len(episodes))
-
-    dates = [ep.get("created_at", "") for ep in episodes if ep.get("created_at")]
-    if dates:
-        facts["first_interaction"] = min(dates)
-        facts["last_interaction"] = max(dates)
-
+    """Simple heuristic fact extraction (no LLM), in a single pass."""
+    total = 0
+    first: str | None = None
+    last: str | None = None
     sessions: set[object] = set()
+
     for ep in episodes:
+        total += 1
+        created_at = ep.get("created_at")
+        if created_at:
+            if first is None or created_at < first:
+                first = created_at
+            if last is None or created_at > last:
+                last = created_at
         metadata = ep.get("metadata")
         if isinstance(metadata, dict):
             session_id = metadata.get("session_id")
             if session_id is not None:
                 sessions.add(session_id)
+
+    facts: dict[str, str] = {"total_interactions": str(total)}
+    if first is not None and last is not None:
+        facts["first_interaction"] = first
+        facts["last_interaction"] = last
     if sessions:
         facts["session_count"] = str(len(sessions))
 
@@ -192,7 +220,6 @@ def retention_cli(
     ] = "brain.contextunity.ts.net:50051",
 ) -> None:
     """CLI entry point for retention job."""
-    import asyncio
     import json
 
     logging.basicConfig(
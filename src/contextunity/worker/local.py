@@ -29,7 +29,7 @@ async def create_local_worker() -> grpc.aio.Server:
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
         huey_instance = SqliteHuey("contextunity-worker-local", filename=str(db_path))
-        logger.info(f"SqliteHuey initialized at {db_path}")
+        logger.info("SqliteHuey initialized at %s", db_path)
     except ImportError:
         logger.warning("Huey not installed. Worker will run without a backend.")
         huey_instance = None
@@ -5,12 +5,17 @@ Provides helpers for creating and managing scheduled workflows.
 
 from __future__ import annotations
 
-import argparse
+import asyncio
 import logging
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from contextunity.core import get_contextunit_logger
 from contextunity.core.types import is_object_list
+from contextunity.worker.core.worker import get_temporal_client
 from temporalio.client import (
     Client,
     Schedule,
@@ -18,10 +23,42 @@ from temporalio.client import (
     ScheduleSpec,
 )
 
-logger = get_contextunit_logger(__name__)
+if TYPE_CHECKING:
+    import argparse
 
+logger = get_contextunit_logger(__name__)
 
-@dataclass
+# Default cap on in-flight schedule RPCs for the bulk helpers.
+BULK_CONCURRENCY = 16
+
+# Temporal accepts 5 cron fields (minute..day_of_week), 6 (plus a trailing
+# year) or 7 (seconds first, year last), "@" macros such as @daily/@every,
+# an optional CRON_TZ=/TZ= prefix and a trailing "# comment".
+_CRON_FIELD = re.compile(r"^[0-9A-Za-z*?/,#-]+$")
+_CRON_TZ_PREFIX = re.compile(r"^(?:CRON_)?TZ=\S+\s+")
+_CRON_COMMENT = re.compile(r"\s+#.*$")
+
+
+@lru_cache(maxsize=128)
+def _validated_cron(expr: str) -> str:
+    """Return ``expr`` if it is structurally a Temporal cron expression.
+
+    This is a shape check only, so malformed schedules fail before the
+    Temporal round-trip; the server still performs full range validation.
+    """
+    body = _CRON_TZ_PREFIX.sub("", expr.strip(), count=1)
+    body = _CRON_COMMENT.sub("", body)
+    if body.startswith("@"):
+        if len(body) > 1:
+            return expr
+    else:
+        fields = body.split()
+        if 5 <= len(fields) <= 7 and all(_CRON_FIELD.match(field) for field in fields):
+            return expr
+    raise ValueError(f"Invalid cron expression: {expr!r}")
+
+
+@dataclass(frozen=True, slots=True)
 class ScheduleConfig:
     """Configuration for a scheduled Temporal workflow."""
 
@@ -72,15 +109,6 @@ def schedule_config_from_wire(data: dict[str, object]) -> ScheduleConfig:
     )
 
 
-async def get_temporal_client(host: str | None = None) -> Client:
-    """Get Temporal client (host from config if not provided)."""
-    if host is None:
-        from contextunity.worker.config import get_config
-
-        host = get_config().temporal_host
-    return await Client.connect(host)
-
-
 async def create_schedule(
     client: Client,
     schedule_id: str,
@@ -91,6 +119,7 @@ async def create_schedule(
     workflow_id: str | None = None,
 ) -> str:
     """Create a Temporal schedule for a workflow."""
+    cron = _validated_cron(cron)
     wf_id = workflow_id or f"{schedule_id}-scheduled"
 
     try:
@@ -120,21 +149,30 @@ async def create_schedule(
 async def list_schedules(
     client: Client | None = None,
     temporal_host: str | None = None,
-) -> list[dict[str, str | None]]:
-    """List all schedules."""
+    page_size: int = 1000,
+) -> AsyncIterator[dict[str, str | None]]:
+    """Yield schedules as Temporal pages them in.
+
+    Temporal list pages are chained by ``next_page_token``, so pages cannot be
+    requested in parallel; ``page_size`` trades RPC count against page latency.
+    """
     if client is None:
         client = await get_temporal_client(temporal_host)
 
-    schedules: list[dict[str, str | None]] = []
-    async for schedule in await client.list_schedules():
-        schedules.append(
-            {
-                "id": schedule.id,
-                "workflow": None,
-            }
-        )
+    async for schedule in await client.list_schedules(page_size=page_size):
+        yield {
+            "id": schedule.id,
+            "workflow": None,
+        }
+
 
-    return schedules
+async def list_schedules_all(
+    client: Client | None = None,
+    temporal_host: str | None = None,
+    page_size: int = 1000,
+) -> list[dict[str, str | None]]:
+    """List all schedules as a materialized list."""
+    return [entry async for entry in list_schedules(client, temporal_host, page_size)]
 
 
 async def delete_schedule(
@@ -194,6 +232,64 @@ async def unpause_schedule(
         return False
 
 
+async def _run_bulk(
+    action: Callable[..., Awaitable[bool]],
+    schedule_ids: Sequence[str],
+    client: Client | None,
+    temporal_host: str | None,
+    concurrency: int,
+) -> dict[str, bool]:
+    """Apply a single-schedule helper to many IDs over one client, bounded by ``concurrency``."""
+    if client is None:
+        client = await get_temporal_client(temporal_host)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(schedule_id: str) -> bool:
+        async with semaphore:
+            return await action(schedule_id, client=client)
+
+    results = await asyncio.gather(*(_one(schedule_id) for schedule_id in schedule_ids))
+    outcome = dict(zip(schedule_ids, results, strict=True))
+    logger.info(
+        "%s: %d succeeded, %d failed",
+        action.__name__,
+        sum(results),
+        len(results) - sum(results),
+    )
+    return outcome
+
+
+async def delete_schedules(
+    schedule_ids: Sequence[str],
+    client: Client | None = None,
+    temporal_host: str | None = None,
+    concurrency: int = BULK_CONCURRENCY,
+) -> dict[str, bool]:
+    """Delete many schedules concurrently; returns success per ID."""
+    return await _run_bulk(delete_schedule, schedule_ids, client, temporal_host, concurrency)
+
+
+async def pause_schedules(
+    schedule_ids: Sequence[str],
+    client: Client | None = None,
+    temporal_host: str | None = None,
+    concurrency: int = BULK_CONCURRENCY,
+) -> dict[str, bool]:
+    """Pause many schedules concurrently; returns success per ID."""
+    return await _run_bulk(pause_schedule, schedule_ids, client, temporal_host, concurrency)
+
+
+async def unpause_schedules(
+    schedule_ids: Sequence[str],
+    client: Client | None = None,
+    temporal_host: str | None = None,
+    concurrency: int = BULK_CONCURRENCY,
+) -> dict[str, bool]:
+    """Unpause many schedules concurrently; returns success per ID."""
+    return await _run_bulk(unpause_schedule, schedule_ids, client, temporal_host, concurrency)
+
+
 def _schedule_command(namespace: argparse.Namespace) -> str:
     """Return the schedule CLI subcommand name."""
     raw = dict(vars(namespace))
@@ -203,30 +299,32 @@ def _schedule_command(namespace: argparse.Namespace) -> str:
     return command
 
 
-def _schedule_id(namespace: argparse.Namespace) -> str:
-    """Return the schedule id positional argument."""
+def _schedule_ids(namespace: argparse.Namespace) -> list[str]:
+    """Return the schedule id positional arguments."""
     raw = dict(vars(namespace))
-    schedule_id = raw.get("schedule_id")
-    if not isinstance(schedule_id, str) or not schedule_id:
+    schedule_ids = raw.get("schedule_ids")
+    if not isinstance(schedule_ids, list) or not schedule_ids:
         raise SystemExit("schedule_id is required")
-    return schedule_id
+    return [str(schedule_id) for schedule_id in schedule_ids]
 
 
 async def _cli_main() -> None:
     """CLI entry point."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Manage Temporal schedules")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     _ = subparsers.add_parser("list", help="List all schedules")
 
-    delete_parser = subparsers.add_parser("delete", help="Delete a schedule")
-    _ = delete_parser.add_argument("schedule_id", help="Schedule ID to delete")
+    delete_parser = subparsers.add_parser("delete", help="Delete schedules")
+    _ = delete_parser.add_argument("schedule_ids", nargs="+", metavar="schedule_id", help="Schedule ID(s) to delete")
 
-    pause_parser = subparsers.add_parser("pause", help="Pause a schedule")
-    _ = pause_parser.add_argument("schedule_id", help="Schedule ID to pause")
+    pause_parser = subparsers.add_parser("pause", help="Pause schedules")
+    _ = pause_parser.add_argument("schedule_ids", nargs="+", metavar="schedule_id", help="Schedule ID(s) to pause")
 
-    unpause_parser = subparsers.add_parser("unpause", help="Unpause a schedule")
-    _ = unpause_parser.add_argument("schedule_id", help="Schedule ID to unpause")
+    unpause_parser = subparsers.add_parser("unpause", help="Unpause schedules")
+    _ = unpause_parser.add_argument("schedule_ids", nargs="+", metavar="schedule_id", help="Schedule ID(s) to unpause")
 
     namespace = parser.parse_args()
     command = _schedule_command(namespace)
@@ -235,26 +333,24 @@ async def _cli_main() -> None:
 
     match command:
         case "list":
-            schedules = await list_schedules()
-            if schedules:
-                for entry in schedules:
-                    print(f"  {entry['id']}: {entry['workflow']}")
-            else:
+            found = False
+            async for entry in list_schedules():
+                found = True
+                print(f"  {entry['id']}: {entry['workflow']}")
+            if not found:
                 print("No schedules found")
         case "delete":
-            _ = await delete_schedule(_schedule_id(namespace))
+            _ = await delete_schedules(_schedule_ids(namespace))
         case "pause":
-            _ = await pause_schedule(_schedule_id(namespace))
+            _ = await pause_schedules(_schedule_ids(namespace))
         case "unpause":
-            _ = await unpause_schedule(_schedule_id(namespace))
+            _ = await unpause_schedules(_schedule_ids(namespace))
         case _:
             raise SystemExit(f"Unknown command: {command!r}")
 
 
 def main() -> None:
     """Run the CLI schedule command runner."""
-    import asyncio
-
     asyncio.run(_cli_main())
 
 
@@ -267,8 +363,12 @@ __all__ = [
     "get_temporal_client",
     "create_schedule",
     "list_schedules",
+    "list_schedules_all",
     "delete_schedule",
     "pause_schedule",
     "unpause_schedule",
+    "delete_schedules",
+    "pause_schedules",
+    "unpause_schedules",
     "schedule_config_from_wire",
 ]
@@ -10,27 +10,23 @@ import asyncio
 import grpc
 
 # Fail-closed: service MUST NOT start without gRPC contracts.
-from contextunity.core import get_contextunit_logger, worker_pb2_grpc
+from contextunity.core import get_contextunit_logger, setup_logging, worker_pb2_grpc
+from contextunity.core.grpc_utils import graceful_shutdown, start_grpc_server
 
 from .config import get_config
+from .interceptors import WorkerPermissionInterceptor
+from .service import WorkerService
 
 logger = get_contextunit_logger(__name__)
 
 
 async def serve() -> None:
     """Start the gRPC server for Worker Service."""
-    from contextunity.core import (
-        get_contextunit_logger,
-        setup_logging,
-    )
-
     cfg = get_config()
     setup_logging(config=cfg, service_name="contextunity.worker")
     svc_logger = get_contextunit_logger(__name__)
 
     # Build interceptor list: security + domain permission checks
-    from .interceptors import WorkerPermissionInterceptor
-
     interceptors: list[grpc.aio.ServerInterceptor] = [
         WorkerPermissionInterceptor(
             shield_url=cfg.shield_url,
@@ -44,16 +40,12 @@ async def serve() -> None:
     )
 
     # Register Worker Service
-    from .service import WorkerService
-
     worker_service = WorkerService()
     worker_pb2_grpc.add_WorkerServiceServicer_to_server(worker_service, server)
     svc_logger.info("Worker Service registered")
 
     port = cfg.port
 
-    from contextunity.core.grpc_utils import graceful_shutdown, start_grpc_server
-
     heartbeat_task = await start_grpc_server(
         server,
         "worker",
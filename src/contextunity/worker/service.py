@@ -7,6 +7,7 @@ from contextunity.core import (
     get_contextunit_logger,
     worker_pb2_grpc,
 )
+from contextunity.core.authz import authorize, get_auth_context
 from contextunity.core.exceptions import SecurityError
 from contextunity.core.sdk.payload import (
     get_dict_list,
@@ -38,8 +39,6 @@ def _get_verified_token(_context: ServicerContext[ContextUnitProto, ContextUnitP
     Raises:
         SecurityError: on missing/expired token (mapped to UNAUTHENTICATED by grpc_error_handler).
     """
-    from contextunity.core.authz.context import get_auth_context
-
     auth_ctx = get_auth_context()
     if auth_ctx is not None:
         return auth_ctx.token
@@ -106,8 +105,6 @@ def _authorize_worker(
     Raises:
         SecurityError: On authorization failure.
     """
-    from contextunity.core.authz import authorize, get_auth_context
-
     auth_ctx = get_auth_context()
     decision = authorize(
         auth_ctx if auth_ctx is not None else token,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextunity.core.worker_pb2 as worker_pb2
+import pytest
 from contextunity.worker.interceptors import (
     RPC_PERMISSION_MAP,
     WorkerPermissionInterceptor,
@@ -30,6 +31,10 @@ class TestRpcPermissionMap:
         for rpc, perm in RPC_PERMISSION_MAP.items():
             assert ":" in perm, f"{rpc} permission '{perm}' must be namespaced (e.g. worker:read)"
 
+    def test_map_is_read_only(self):
+        with pytest.raises(TypeError):
+            RPC_PERMISSION_MAP["StartWorkflow"] = "worker:read"  # type: ignore[index]
+
 
 # ── Proto-driven coverage ──
 
@@ -2,6 +2,10 @@
 Tests for WorkerRegistry.
 """
 
+import sys
+from types import ModuleType, SimpleNamespace
+
+from contextunity.worker.core import registry as registry_mod
 from contextunity.worker.core.registry import WorkerRegistry, get_registry
 
 
@@ -17,8 +21,8 @@ class TestWorkerRegistry:
         assert mod is not None
         assert mod.name == "test-mod"
         assert mod.queue == "test-queue"
-        assert mod.workflows == []
-        assert mod.activities == []
+        assert mod.workflows == ()
+        assert mod.activities == ()
         assert mod.enabled is True
 
     def test_register_duplicate_skipped(self):
@@ -41,6 +45,15 @@ class TestWorkerRegistry:
         names = {m.name for m in all_mods}
         assert names == {"a", "b"}
 
+    def test_get_module_names(self):
+        """Verify get_module_names includes disabled modules."""
+        registry = WorkerRegistry()
+        registry.register(name="a", queue="qa")
+        registry.register(name="b", queue="qb")
+        registry.disable_module("b")
+
+        assert registry.get_module_names() == frozenset({"a", "b"})
+
     def test_get_enabled_modules(self):
         """Verify enable/disable filtering works."""
         registry = WorkerRegistry()
@@ -52,6 +65,21 @@ class TestWorkerRegistry:
         assert len(enabled) == 1
         assert enabled[0].name == "on"
 
+    def test_module_views_cached_until_mutation(self):
+        """Verify cached views are reused and refreshed after changes."""
+        registry = WorkerRegistry()
+        registry.register(name="a", queue="q")
+
+        first = registry.get_enabled_modules()
+        assert registry.get_enabled_modules() is first
+
+        registry.register(name="b", queue="q")
+        assert [m.name for m in registry.get_enabled_modules()] == ["a", "b"]
+
+        registry.disable_module("a")
+        assert [m.name for m in registry.get_enabled_modules()] == ["b"]
+        assert len(registry.get_all_modules()) == 2
+
     def test_get_queues(self):
         """Verify get_queues groups modules by queue."""
         registry = WorkerRegistry()
@@ -64,6 +92,30 @@ class TestWorkerRegistry:
         assert len(queues["shared"]) == 2
         assert len(queues["solo"]) == 1
 
+    def test_get_queue_plan_aggregates_per_queue(self):
+        """Verify get_queue_plan concatenates workflows/activities per queue."""
+
+        async def act_a(): ...
+
+        async def act_b(): ...
+
+        class WfA: ...
+
+        registry = WorkerRegistry()
+        registry.register(name="a", queue="shared", workflows=[WfA], activities=[act_a])
+        registry.register(name="b", queue="shared", activities=[act_b])
+        registry.register(name="c", queue="solo")
+
+        plan = registry.get_queue_plan()
+        assert plan["shared"].modules == ("a", "b")
+        assert plan["shared"].workflows == (WfA,)
+        assert plan["shared"].activities == (act_a, act_b)
+        assert registry.get_queue_plan() is plan
+
+        filtered = registry.get_queue_plan({"b"})
+        assert set(filtered) == {"shared"}
+        assert filtered["shared"].activities == (act_b,)
+
     def test_get_module_not_found(self):
         """Verify get_module returns None for unknown."""
         registry = WorkerRegistry()
@@ -80,6 +132,44 @@ class TestWorkerRegistry:
         assert mod.enabled is True
 
 
+class TestDiscoverPlugins:
+    """Test package discovery from WORKER_MODULES and built-ins."""
+
+    def test_registers_packages_in_configured_order(self, monkeypatch):
+        """Verify packages register in configured order."""
+        for name in ("fake_worker_a", "fake_worker_b"):
+            mod = ModuleType(name)
+            mod.register_all = lambda registry, name=name: registry.register(name=name, queue="q")
+            monkeypatch.setitem(sys.modules, name, mod)
+        monkeypatch.setattr(
+            "contextunity.worker.config.get_config",
+            lambda: SimpleNamespace(worker_modules="fake_worker_a, fake_worker_b, missing_worker_pkg"),
+        )
+
+        registry = WorkerRegistry()
+        registry.discover_plugins()
+
+        names = [m.name for m in registry.get_all_modules()]
+        assert names[:2] == ["fake_worker_a", "fake_worker_b"]
+        assert "orchestrator" in names
+
+    def test_registers_entry_point_packages(self, monkeypatch):
+        """Verify packages advertised via entry points are discovered."""
+        mod = ModuleType("fake_worker_ep")
+        mod.register_all = lambda registry: registry.register(name="from-ep", queue="q")
+        monkeypatch.setitem(sys.modules, "fake_worker_ep", mod)
+        monkeypatch.setattr(registry_mod, "_entry_point_packages", lambda: ("fake_worker_ep",))
+        monkeypatch.setattr(
+            "contextunity.worker.config.get_config",
+            lambda: SimpleNamespace(worker_modules=""),
+        )
+
+        registry = WorkerRegistry()
+        registry.discover_plugins()
+
+        assert registry.get_module("from-ep") is not None
+
+
 class TestGetRegistry:
     """Test global registry singleton."""
 
@@ -88,3 +178,9 @@ class TestGetRegistry:
         r1 = get_registry()
         r2 = get_registry()
         assert r1 is r2
+
+    def test_cache_clear_creates_new(self):
+        """Verify cache_clear resets the singleton."""
+        r1 = get_registry()
+        get_registry.cache_clear()
+        assert get_registry() is not r1
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from contextunity.worker.jobs.retention import _extract_facts_simple
+from unittest.mock import AsyncMock
+
+import pytest
+from contextunity.worker.jobs.retention import _distill_episodes, _extract_facts_simple
 
 
 class TestExtractFactsSimple:
@@ -64,3 +67,35 @@ class TestRetentionSchedule:
 
         retention = [s for s in DEFAULT_SCHEDULES if "retention" in s.schedule_id]
         assert retention == []
+
+
+class TestDistillEpisodes:
+    """Test fact upserts during distillation."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_all_facts_and_skips_failures(self):
+        def upsert_fact(**kwargs):
+            if kwargs["user_id"] == "u2" and kwargs["key"] == "total_interactions":
+                raise RuntimeError("boom")
+
+        brain = AsyncMock()
+        brain.upsert_fact.side_effect = upsert_fact
+        episodes = [
+            {"id": "1", "user_id": "u1", "created_at": "2026-01-01"},
+            {"id": "2", "user_id": "u2", "created_at": "2026-01-02"},
+        ]
+
+        count = await _distill_episodes(brain=brain, episodes=episodes, tenant_id="t1")
+
+        assert brain.upsert_fact.await_count == 6
+        assert count == 5
+
+    @pytest.mark.asyncio
+    async def test_dry_run_makes_no_calls(self):
+        brain = AsyncMock()
+        episodes = [{"id": "1", "user_id": "u1", "created_at": "2026-01-01"}]
+
+        count = await _distill_episodes(brain=brain, episodes=episodes, tenant_id="t1", dry_run=True)
+
+        brain.upsert_fact.assert_not_awaited()
+        assert count == 3
@@ -1,5 +1,10 @@
 """Tests for worker schedule payload conversion."""
 
+import asyncio
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from contextunity.worker.schedules import schedule_config_from_wire
 
@@ -38,6 +43,18 @@ class TestScheduleConfig:
         with pytest.raises(ValueError, match=missing_key):
             schedule_config_from_wire(payload)
 
+    def test_config_is_immutable(self):
+        config = schedule_config_from_wire(
+            {
+                "schedule_id": "test-schedule",
+                "workflow_name": "TestWorkflow",
+                "task_queue": "test-tasks",
+                "cron": "0 0 * * *",
+            }
+        )
+        with pytest.raises(FrozenInstanceError):
+            config.cron = "* * * * *"  # type: ignore[misc]
+
     def test_from_wire_ignores_non_list_args_and_non_string_description(self):
         config = schedule_config_from_wire(
             {
@@ -51,3 +68,167 @@ class TestScheduleConfig:
         )
         assert config.args is None
         assert config.description == ""
+
+
+class TestScheduleClient:
+    """Schedule helpers use the worker's cached Temporal client factory."""
+
+    def test_reexports_core_client_factory(self):
+        from contextunity.worker import schedules
+        from contextunity.worker.core import worker
+
+        assert schedules.get_temporal_client is worker.get_temporal_client
+
+
+class TestTemporalEngineRegisterSchedules:
+    """Manifest schedules are registered concurrently with per-item errors."""
+
+    @pytest.mark.asyncio
+    async def test_counts_only_successful_registrations(self):
+        from contextunity.worker.engines.temporal_engine import TemporalEngine
+
+        engine = TemporalEngine("temporal:7233")
+        engine._client = AsyncMock()
+        valid = {
+            "schedule_id": "nightly",
+            "workflow_name": "TestWorkflow",
+            "task_queue": "test-tasks",
+            "cron": "0 0 * * *",
+        }
+
+        with patch("contextunity.worker.schedules.create_schedule", new=AsyncMock()) as create:
+            count = await engine.register_schedules(
+                "project",
+                "tenant-a",
+                [valid, {"id": "broken"}, {**valid, "schedule_id": "hourly"}],
+            )
+
+        assert count == 2
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_registrations(self, monkeypatch):
+        from contextunity.worker import schedules
+        from contextunity.worker.engines.temporal_engine import TemporalEngine
+
+        monkeypatch.setattr(schedules, "BULK_CONCURRENCY", 2)
+        in_flight = 0
+        peak = 0
+
+        async def create_schedule(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return kwargs["schedule_id"]
+
+        engine = TemporalEngine("temporal:7233")
+        engine._client = AsyncMock()
+        manifest = [
+            {"schedule_id": f"s{i}", "workflow_name": "TestWorkflow", "task_queue": "q", "cron": "0 0 * * *"}
+            for i in range(6)
+        ]
+
+        monkeypatch.setattr(schedules, "create_schedule", create_schedule)
+        count = await engine.register_schedules("project", "tenant-a", manifest)
+
+        assert count == 6
+        assert peak == 2
+
+
+class _FakeScheduleIterator:
+    def __init__(self, ids: list[str]):
+        self._ids = iter(ids)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            schedule_id = next(self._ids)
+        except StopIteration:
+            raise StopAsyncIteration from None
+        return SimpleNamespace(id=schedule_id)
+
+
+class TestListSchedules:
+    """list_schedules streams entries; list_schedules_all materializes them."""
+
+    @pytest.mark.asyncio
+    async def test_streams_entries(self):
+        from contextunity.worker.schedules import list_schedules
+
+        client = AsyncMock()
+        client.list_schedules.return_value = _FakeScheduleIterator(["a", "b"])
+
+        ids = [entry["id"] async for entry in list_schedules(client, page_size=50)]
+
+        assert ids == ["a", "b"]
+        client.list_schedules.assert_awaited_once_with(page_size=50)
+
+    @pytest.mark.asyncio
+    async def test_list_all_returns_list(self):
+        from contextunity.worker.schedules import list_schedules_all
+
+        client = AsyncMock()
+        client.list_schedules.return_value = _FakeScheduleIterator(["a"])
+
+        assert await list_schedules_all(client) == [{"id": "a", "workflow": None}]
+
+
+class TestBulkScheduleOps:
+    """Bulk helpers fan out over one client and report per-ID success."""
+
+    @pytest.mark.asyncio
+    async def test_delete_schedules_reports_each_id(self):
+        from contextunity.worker.schedules import delete_schedules
+
+        client = AsyncMock()
+        handle = AsyncMock()
+        handle.delete.side_effect = [None, RuntimeError("missing"), None]
+        client.get_schedule_handle = lambda schedule_id: handle
+
+        result = await delete_schedules(["a", "b", "c"], client=client, concurrency=1)
+
+        assert result == {"a": True, "b": False, "c": True}
+        assert handle.delete.await_count == 3
+
+
+class TestValidatedCron:
+    """Cron expressions are shape-checked before reaching Temporal."""
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "0 0 * * *",
+            "*/5 * * * *",
+            "30 9 * * MON-FRI 2027",
+            "0 30 9 * * MON-FRI *",
+            "0 9 * * MON#2",
+            "@daily",
+            "@every 1h",
+            "CRON_TZ=UTC 0 3 * * *",
+            "0 3 * * * # nightly retention",
+        ],
+    )
+    def test_accepts_temporal_cron(self, expr: str):
+        from contextunity.worker.schedules import _validated_cron
+
+        assert _validated_cron(expr) == expr
+
+    @pytest.mark.parametrize("expr", ["", "* * *", "@", "0 0 * * * * * *", "0 0 * * ; rm", "# nightly"])
+    def test_rejects_malformed_cron(self, expr: str):
+        from contextunity.worker.schedules import _validated_cron
+
+        with pytest.raises(ValueError, match="Invalid cron"):
+            _validated_cron(expr)
+
+    @pytest.mark.asyncio
+    async def test_create_schedule_rejects_before_rpc(self):
+        from contextunity.worker.schedules import create_schedule
+
+        client = AsyncMock()
+        with pytest.raises(ValueError):
+            await create_schedule(client, "bad", "TestWorkflow", "test-tasks", "not a cron")
+        client.create_schedule.assert_not_awaited()
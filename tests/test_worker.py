@@ -0,0 +1,120 @@
+"""Tests for the Temporal worker factory helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from contextunity.worker.core import worker
+from contextunity.worker.core.registry import WorkerRegistry
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_cache():
+    worker.clear_temporal_clients()
+    yield
+    worker.clear_temporal_clients()
+
+
+class TestGetTemporalClient:
+    """Verify Temporal clients are cached per host."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_for_same_host(self):
+        connect = AsyncMock(side_effect=lambda host: object())
+        with patch.object(worker.Client, "connect", connect):
+            c1 = await worker.get_temporal_client("temporal-a:7233")
+            c2 = await worker.get_temporal_client("temporal-a:7233")
+
+        assert c1 is c2
+        connect.assert_awaited_once_with("temporal-a:7233")
+
+    @pytest.mark.asyncio
+    async def test_separate_clients_per_host(self):
+        connect = AsyncMock(side_effect=lambda host: object())
+        with patch.object(worker.Client, "connect", connect):
+            c1 = await worker.get_temporal_client("temporal-a:7233")
+            c2 = await worker.get_temporal_client("temporal-b:7233")
+
+        assert c1 is not c2
+        assert connect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_host_does_not_block_other_hosts(self):
+        release = asyncio.Event()
+
+        async def connect(host):
+            if host == "temporal-slow:7233":
+                await release.wait()
+            return object()
+
+        with patch.object(worker.Client, "connect", AsyncMock(side_effect=connect)):
+            slow = asyncio.create_task(worker.get_temporal_client("temporal-slow:7233"))
+            await asyncio.sleep(0)
+            fast = await asyncio.wait_for(worker.get_temporal_client("temporal-b:7233"), timeout=1)
+            release.set()
+            await slow
+
+        assert fast is not None
+
+
+class TestCreateWorker:
+    """Verify Worker construction options."""
+
+    @pytest.mark.asyncio
+    async def test_omits_activity_cap_when_unset(self):
+        with patch.object(worker, "Worker") as worker_cls:
+            await worker.create_worker(object(), "q")
+
+        assert "max_concurrent_activities" not in worker_cls.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_passes_activity_cap_when_set(self):
+        with patch.object(worker, "Worker") as worker_cls:
+            await worker.create_worker(object(), "q", max_concurrent_activities=4)
+
+        assert worker_cls.call_args.kwargs["max_concurrent_activities"] == 4
+
+
+class TestRunWorkers:
+    """Verify run_workers start-up guards."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_modules_skip_temporal_connect(self, monkeypatch):
+        registry = WorkerRegistry()
+        registry._discovered = True
+        registry.register(name="known", queue="q")
+        monkeypatch.setattr(worker, "get_registry", lambda: registry)
+
+        connect = AsyncMock()
+        with patch.object(worker.Client, "connect", connect):
+            await worker.run_workers(modules=["missing"])
+
+        connect.assert_not_awaited()
+
+
+class TestTemporalEngineClient:
+    """Verify the Temporal engine routes through the shared client cache."""
+
+    @pytest.mark.asyncio
+    async def test_engines_share_cached_client(self):
+        from contextunity.worker.engines.temporal_engine import TemporalEngine
+
+        connect = AsyncMock(side_effect=lambda host: object())
+        with patch.object(worker.Client, "connect", connect):
+            c1 = await TemporalEngine("temporal-a:7233")._get_client()
+            c2 = await TemporalEngine("temporal-a:7233")._get_client()
+
+        assert c1 is c2
+        connect.assert_awaited_once_with("temporal-a:7233")
+
+
+class TestParseTenants:
+    """Verify WORKER_TENANTS parsing."""
+
+    def test_splits_and_strips(self):
+        assert worker._parse_tenants(" acme, beta ,,gamma ") == ("acme", "beta", "gamma")
+
+    def test_empty_value(self):
+        assert worker._parse_tenants("") == ()